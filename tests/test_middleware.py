@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import pytest
+import time
 import gevent
 import zerorpc
 
@@ -187,3 +188,81 @@ def test_custom_header():
 
     client.close()
     srv.close()
+
+
+def test_client_pool():
+    app = Zask(__name__)
+    endpoint = random_ipc_endpoint()
+    app.config['ZERORPC_SOME_SERVICE'] = {
+        '1.0': endpoint,
+        '2.0': random_ipc_endpoint(),  # nobody is listening
+        'default': '1.0'
+    }
+    rpc = ZeroRPC(app, middlewares=[CONFIG_ENDPOINT_MIDDLEWARE])
+
+    class Srv(rpc.Server):
+        __version__ = "1.0"
+        __service_name__ = "some_service"
+
+        def hello(self):
+            return 'world'
+
+    srv = Srv()
+    gevent.spawn(srv.run)
+
+    client = rpc.get_client('some_service')
+    assert client.hello() == 'world'
+    assert rpc.get_client('some_service') is client
+    assert rpc.get_client('some_service', version='1.0') is client
+    assert rpc.get_client('some_service', version='2.0') is not client
+    assert len(rpc.client_pool) == 2
+
+    # a client which can't answer the health check is replaced
+    rpc.client_pool.ping_interval = 0
+    rpc.client_pool.ping_timeout = 0.1
+    other = rpc.get_client('some_service', version='2.0')
+    assert rpc.get_client('some_service', version='2.0') is not other
+    assert rpc.get_client('some_service') is client
+
+    rpc.client_pool.max_size = 1
+    rpc.get_client('some_service', version='2.0')
+    assert len(rpc.client_pool) == 1
+    assert rpc.get_client('some_service') is not client
+
+    rpc.client_pool.idle_timeout = 0
+    rpc.client_pool.get('some_service')
+    rpc.client_pool.close()
+    assert len(rpc.client_pool) == 0
+    srv.close()
+
+
+def test_call_many():
+    app = Zask(__name__)
+    endpoint = random_ipc_endpoint()
+    rpc = ZeroRPC(app, middlewares=None)
+
+    class Srv(object):
+
+        def add(self, a, b):
+            gevent.sleep(0.1)
+            return a + b
+
+        def fail(self):
+            raise ValueError('failed')
+
+    srv = rpc.Server(Srv())
+    srv.bind(endpoint)
+    gevent.spawn(srv.run)
+
+    client = rpc.Client(endpoint)
+    started = time.time()
+    results = client.call_many([('add', (i, 1)) for i in range(10)] +
+                               [('fail', ())])
+    # replies are gathered concurrently, not one after the other
+    assert time.time() - started < 0.5
+    assert results[:10] == [i + 1 for i in range(10)]
+    assert isinstance(results[10], zerorpc.RemoteError)
+    assert results[10].name == 'ValueError'
+
+    client.close()
+    srv.close()
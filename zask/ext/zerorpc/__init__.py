@@ -14,6 +14,8 @@ import sys
 import time
 import uuid
 
+from collections import OrderedDict
+
 import zerorpc
 from zerorpc.heartbeat import HeartBeatOnChannel
 from zerorpc.channel import BufferedChannel, logger as channel_logger
@@ -403,12 +405,19 @@ class ZeroRPC(object):
         srv = rpc.Server(Srv(), context=default_context)
         client = rpc.Client(context=default_context)
 
+    Creating a client opens a new socket every time. If you call the same
+    service again and again, get a warm client from the pool instead::
+
+        client = rpc.get_client('some_service')
+        client.hello()
+
     """
 
     def __init__(self, app=None, middlewares=DEFAULT_MIDDLEWARES):
         self._middlewares = middlewares
         self.Server = _Server
         self.Client = _Client
+        self.client_pool = None
         if app is not None:
             self.init_app(app)
         else:
@@ -421,12 +430,31 @@ class ZeroRPC(object):
         """
         self.app = app
         app.config.setdefault('ZERORPC_ACCESS_LOG', '/tmp/zerorpc.access.log')
+        app.config.setdefault('ZERORPC_CLIENT_POOL_SIZE', 64)
+        app.config.setdefault('ZERORPC_CLIENT_POOL_IDLE_TIMEOUT', 300)
+        app.config.setdefault('ZERORPC_CLIENT_POOL_PING_INTERVAL', 30)
         self._init_zerorpc_logger()
         if self._middlewares:
             self._init_zerorpc_context()
         else:
             global _Server_context, _Client_context
             _Server_context = _Client_context = None
+        if self.client_pool is not None:
+            self.client_pool.close()
+        self.client_pool = ClientPool(
+            max_size=app.config['ZERORPC_CLIENT_POOL_SIZE'],
+            idle_timeout=app.config['ZERORPC_CLIENT_POOL_IDLE_TIMEOUT'],
+            ping_interval=app.config['ZERORPC_CLIENT_POOL_PING_INTERVAL'])
+
+    def get_client(self, connect_to, version=None, **kargs):
+        """Returns a connected client from the pool.
+
+        The client is shared with other callers, so don't close it.
+
+        :param connect_to: service name or endpoint
+        :param version: service version, ``None`` for the default one
+        """
+        return self.client_pool.get(connect_to, version=version, **kargs)
 
     def _init_zerorpc_context(self):
         context = zerorpc.Context()
@@ -576,15 +604,55 @@ class _Client(zerorpc.Client):
         self._context.hook_client_before_request(request_event)
         return request_event
 
-    def __call__(self, method, *args, **kargs):
-        timeout = kargs.get('timeout', self._timeout)
+    def _send_request(self, method, args, slots=100):
+        """Opens a channel and emits the request event on it.
+        """
         channel = self._multiplexer.channel()
         hbchan = HeartBeatOnChannel(channel, freq=self._heartbeat_freq,
                                     passive=self._passive_heartbeat)
-        bufchan = BufferedChannel(hbchan, inqueue_size=kargs.get('slots', 100))
+        bufchan = BufferedChannel(hbchan, inqueue_size=slots)
 
         request_event = self._generate_request_event(bufchan, method, args)
         bufchan.emit_event(request_event)
+        return request_event, bufchan
+
+    def call_many(self, calls, timeout=None):
+        """Sends all the requests at once and waits for all the replies::
+
+            results = client.call_many([
+                ('hello', ()),
+                ('add', (1, 2)),
+            ])
+
+        Results are returned in the order of ``calls``. A call which failed
+        doesn't stop the others, its exception is put in the results in place
+        of the return value.
+
+        :param calls: list of ``(method, args)`` pairs
+        :param timeout: timeout of each call, default to the client's one
+        """
+        if timeout is None:
+            timeout = self._timeout
+        sent = []
+        try:
+            for method, args in calls:
+                sent.append(self._send_request(method, tuple(args)))
+        except:
+            for _, bufchan in sent:
+                bufchan.close()
+            raise
+
+        tasks = [gevent.spawn(self._process_response, request_event, bufchan,
+                              timeout)
+                 for request_event, bufchan in sent]
+        gevent.joinall(tasks)
+        return [task.value if task.successful() else task.exception
+                for task in tasks]
+
+    def __call__(self, method, *args, **kargs):
+        timeout = kargs.get('timeout', self._timeout)
+        request_event, bufchan = self._send_request(
+            method, args, kargs.get('slots', 100))
 
         try:
             if kargs.get('async', False) is False:
@@ -603,6 +671,109 @@ class _Client(zerorpc.Client):
             raise
 
 
+class _PoolEntry(object):
+    __slots__ = ('client', 'last_used', 'checked_at')
+
+    def __init__(self, client, now):
+        self.client = client
+        self.last_used = now
+        self.checked_at = now
+
+
+class ClientPool(object):
+
+    """Keeps connected clients around so they can be reused.
+
+    Clients are keyed by service name, version and the resolved endpoint,
+    so a client is dropped as soon as the configuration points the service
+    somewhere else. The least recently used client is closed when the pool
+    is full, clients not used for ``idle_timeout`` seconds are closed, and
+    a client idle for more than ``ping_interval`` seconds is pinged before
+    being handed out again.
+
+    :param max_size: max number of clients kept in the pool
+    :param idle_timeout: seconds before an unused client is closed,
+                         ``None`` to keep it forever
+    :param ping_interval: seconds before an unused client is checked,
+                          ``None`` to never check
+    :param ping_timeout: seconds to wait for the ping reply
+    """
+
+    def __init__(self, max_size=64, idle_timeout=300, ping_interval=30,
+                 ping_timeout=1):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _make_key(self, connect_to, version, kargs):
+        endpoint = connect_to
+        for instance in (_Client_context._middlewares
+                         if _Client_context else []):
+            if isinstance(instance, ConfigMiddleware):
+                version = instance.get_version(connect_to, version)
+                endpoint = instance.get_endpoint(connect_to, version)
+                break
+        if isinstance(endpoint, list):
+            endpoint = tuple(endpoint)
+        return (connect_to, version, endpoint, tuple(sorted(kargs.items())))
+
+    def _is_alive(self, client):
+        try:
+            client('_zerorpc_ping', timeout=self.ping_timeout)
+        except Exception:
+            return False
+        return True
+
+    def _evict_idle(self, now):
+        if self.idle_timeout is None:
+            return
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry.last_used < self.idle_timeout:
+                break
+            del self._entries[key]
+            entry.client.close()
+
+    def get(self, connect_to, version=None, **kargs):
+        """Returns a connected client, creating one if needed.
+        """
+        key = self._make_key(connect_to, version, kargs)
+        now = time.time()
+        self._evict_idle(now)
+
+        entry = self._entries.pop(key, None)
+        if entry is not None and self.ping_interval is not None and \
+                now - entry.checked_at >= self.ping_interval:
+            if self._is_alive(entry.client):
+                entry.checked_at = now
+            else:
+                entry.client.close()
+                entry = None
+        if entry is None:
+            entry = _PoolEntry(_Client(connect_to, version=version, **kargs),
+                               now)
+        entry.last_used = now
+        # re-inserting keeps the most recently used client at the end
+        self._entries[key] = entry
+
+        while len(self._entries) > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            evicted.client.close()
+        return entry.client
+
+    def close(self):
+        """Closes all the clients in the pool.
+        """
+        while self._entries:
+            _, entry = self._entries.popitem()
+            entry.client.close()
+
+
 class HandleEndpoint(object):
 
     @staticmethod